@@ -26,8 +26,23 @@ BRICK_WIDTH = 75
 BRICK_HEIGHT = 20
 BRICK_ROWS = 6
 BRICK_COLS = 10
+BRICK_X0 = 40
+BRICK_Y0 = 50
+BRICK_STRIDE_X = BRICK_WIDTH + 5
+BRICK_STRIDE_Y = BRICK_HEIGHT + 5
+
+# 벽돌 배치 (열별 x 좌표, 행별 y 좌표와 색상)
+BRICK_XS = tuple(col * BRICK_STRIDE_X + BRICK_X0 for col in range(BRICK_COLS))
+BRICK_YS = tuple(row * BRICK_STRIDE_Y + BRICK_Y0 for row in range(BRICK_ROWS))
+BRICK_COLORS = (RED, ORANGE, YELLOW, GREEN, BLUE, PURPLE)
+BRICK_FIELD_BOTTOM = BRICK_YS[-1] + BRICK_HEIGHT
+
+# 부서진 벽돌 자리에 넣는 화면 밖 영역 (어떤 충돌 검사에도 걸리지 않음)
+NO_RECT = pygame.Rect(-1000, -1000, 0, 0)
 
 class Ball:
+    __slots__ = ('x', 'y', 'dx', 'dy', 'size')
+    
     def __init__(self, x, y):
         self.x = x
         self.y = y
@@ -40,7 +55,7 @@ class Ball:
         self.y += self.dy
     
     def draw(self, screen):
-        pygame.draw.circle(screen, WHITE, (int(self.x), int(self.y)), self.size)
+        return pygame.draw.circle(screen, WHITE, (int(self.x), int(self.y)), self.size)
     
     def bounce_x(self):
         self.dx = -self.dx
@@ -49,52 +64,83 @@ class Ball:
         self.dy = -self.dy
 
 class Paddle:
+    __slots__ = ('x', 'y', 'width', 'height', 'speed', '_rect')
+    
     def __init__(self, x, y):
         self.x = x
         self.y = y
         self.width = PADDLE_WIDTH
         self.height = PADDLE_HEIGHT
         self.speed = 8
+        self._rect = pygame.Rect(x, y, self.width, self.height)
     
     def move_left(self):
         if self.x > 0:
             self.x -= self.speed
+            self._rect.x = self.x
     
     def move_right(self):
         if self.x < SCREEN_WIDTH - self.width:
             self.x += self.speed
+            self._rect.x = self.x
     
     def draw(self, screen):
-        pygame.draw.rect(screen, WHITE, (self.x, self.y, self.width, self.height))
+        return pygame.draw.rect(screen, WHITE, self._rect)
     
     def get_rect(self):
-        return pygame.Rect(self.x, self.y, self.width, self.height)
+        return self._rect
 
 class Brick:
+    __slots__ = ('x', 'y', 'width', 'height', 'color', '_rect')
+    
     def __init__(self, x, y, color):
         self.x = x
         self.y = y
         self.width = BRICK_WIDTH
         self.height = BRICK_HEIGHT
         self.color = color
-        self.destroyed = False
-    
-    def draw(self, screen):
-        if not self.destroyed:
-            pygame.draw.rect(screen, self.color, (self.x, self.y, self.width, self.height))
-            pygame.draw.rect(screen, BLACK, (self.x, self.y, self.width, self.height), 2)
+        self._rect = pygame.Rect(x, y, self.width, self.height)
     
     def get_rect(self):
-        return pygame.Rect(self.x, self.y, self.width, self.height)
+        return self._rect
 
 class Game:
     def __init__(self):
+        # 일반 창 사용: vsync는 SCALED(렌더러) 모드에서만 동작하는데, 그 모드에서는
+        # display.update(rects)가 영역 목록을 무시하고 화면 전체를 내보냄
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("벽돌깨기 게임")
         self.clock = pygame.time.Clock()
         self.font = pygame.font.Font(None, 36)
         self.small_font = pygame.font.Font(None, 24)
         
+        # 바뀌지 않는 문구는 미리 렌더링
+        self._help_text = self.small_font.render("← → 키로 패들 조작, ESC로 종료", True, WHITE)
+        self._help_rect = self._help_text.get_rect(topleft=(SCREEN_WIDTH - 250, SCREEN_HEIGHT - 25))
+        self._game_over_text = self.font.render("게임 오버! R키를 눌러 다시 시작", True, RED)
+        self._game_over_rect = self._game_over_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2))
+        self._win_text = self.font.render("축하합니다! 승리! R키를 눌러 다시 시작", True, GREEN)
+        self._win_rect = self._win_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2))
+        # 점수/생명 문구는 값이 바뀔 때만 다시 렌더링 (값, 이미지, 영역)
+        self._score_cache = (None, None, None)
+        self._lives_cache = (None, None, None)
+        
+        # 화면 갱신 상태 (마지막으로 그린 게임 상태와 공/패들 영역)
+        self._drawn_state = None
+        self._ball_area = None
+        self._paddle_area = None
+        
+        # 색상별 벽돌 이미지 (테두리까지 미리 그려 둠)
+        self._brick_sprites = {}
+        for color in BRICK_COLORS:
+            sprite = pygame.Surface((BRICK_WIDTH, BRICK_HEIGHT))
+            sprite.fill(color)
+            pygame.draw.rect(sprite, BLACK, sprite.get_rect(), 2)
+            self._brick_sprites[color] = sprite.convert()
+        
+        # 충돌 검사용 공 영역 (매 프레임 위치만 갱신)
+        self._ball_rect = pygame.Rect(0, 0, BALL_SIZE * 2, BALL_SIZE * 2)
+        
         self.reset_game()
     
     def reset_game(self):
@@ -105,112 +151,204 @@ class Game:
         self.paddle = Paddle(SCREEN_WIDTH // 2 - PADDLE_WIDTH // 2, SCREEN_HEIGHT - 30)
         
         # 벽돌 생성
-        self.bricks = []
-        colors = [RED, ORANGE, YELLOW, GREEN, BLUE, PURPLE]
+        # brick_grid와 _brick_rects는 행 우선 순서로 모든 칸을 담음
+        self.brick_grid = [
+            Brick(x, y, color)
+            for y, color in zip(BRICK_YS, BRICK_COLORS)
+            for x in BRICK_XS
+        ]
         
-        for row in range(BRICK_ROWS):
-            for col in range(BRICK_COLS):
-                x = col * (BRICK_WIDTH + 5) + 40
-                y = row * (BRICK_HEIGHT + 5) + 50
-                color = colors[row]
-                self.bricks.append(Brick(x, y, color))
+        self.bricks_left = len(self.brick_grid)
+        self._brick_rects = [brick.get_rect() for brick in self.brick_grid]
         
         self.score = 0
         self.lives = 3
         self.game_over = False
         self.game_won = False
+        
+        # 다음 프레임에 화면 전체를 다시 그림
+        self._full_redraw = True
+        self._erase = []
     
     def handle_collisions(self):
+        # 매 프레임 실행되므로 자주 쓰는 값은 지역 변수로 읽어 둠
+        ball = self.ball
+        x, y, size = ball.x, ball.y, ball.size
+        
         # 벽과의 충돌
-        if self.ball.x <= self.ball.size or self.ball.x >= SCREEN_WIDTH - self.ball.size:
-            self.ball.bounce_x()
+        if x <= size or x >= SCREEN_WIDTH - size:
+            ball.bounce_x()
         
-        if self.ball.y <= self.ball.size:
-            self.ball.bounce_y()
+        if y <= size:
+            ball.bounce_y()
         
         # 바닥에 떨어짐
-        if self.ball.y >= SCREEN_HEIGHT:
+        if y >= SCREEN_HEIGHT:
             self.lives -= 1
             if self.lives <= 0:
                 self.game_over = True
             else:
                 # 공 리셋
-                self.ball = Ball(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 100)
+                ball = self.ball = Ball(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 100)
+                x, y = ball.x, ball.y
         
         # 패들과의 충돌
-        ball_rect = pygame.Rect(self.ball.x - self.ball.size, self.ball.y - self.ball.size, 
-                               self.ball.size * 2, self.ball.size * 2)
-        paddle_rect = self.paddle.get_rect()
+        left = int(x - size)
+        top = int(y - size)
+        right = left + size * 2
+        bottom = top + size * 2
+        paddle = self.paddle
+        px = paddle.x
         
-        if ball_rect.colliderect(paddle_rect) and self.ball.dy > 0:
-            self.ball.bounce_y()
+        if (ball.dy > 0
+                and right > px and left < px + paddle.width
+                and bottom > paddle.y and top < paddle.y + paddle.height):
+            ball.bounce_y()
             # 패들의 어느 부분에 맞았는지에 따라 공의 방향 조정
-            hit_pos = (self.ball.x - self.paddle.x) / self.paddle.width
-            self.ball.dx = (hit_pos - 0.5) * 8
-        
-        # 벽돌과의 충돌
-        for brick in self.bricks:
-            if not brick.destroyed:
-                brick_rect = brick.get_rect()
-                if ball_rect.colliderect(brick_rect):
-                    brick.destroyed = True
-                    self.score += 10
-                    self.ball.bounce_y()
-                    break
-        
-        # 모든 벽돌이 파괴되었는지 확인
-        if all(brick.destroyed for brick in self.bricks):
-            self.game_won = True
-    
-    def draw(self):
-        self.screen.fill(BLACK)
+            hit_pos = (x - px) / paddle.width
+            ball.dx = (hit_pos - 0.5) * 8
         
-        # 게임 객체들 그리기
-        self.ball.draw(self.screen)
-        self.paddle.draw(self.screen)
-        
-        for brick in self.bricks:
-            brick.draw(self.screen)
+        # 벽돌과의 충돌 (공이 벽돌 영역 아래에 있으면 검사 생략)
+        if top >= BRICK_FIELD_BOTTOM:
+            return
+        ball_rect = self._ball_rect
+        ball_rect.x = left
+        ball_rect.y = top
+        index = self.find_brick_hit(ball_rect)
+        if index >= 0:
+            brick = self.brick_grid[index]
+            self._brick_rects[index] = NO_RECT
+            self._erase.append(brick.get_rect())
+            self.bricks_left -= 1
+            self.score += 10
+            ball.bounce_y()
+            
+            # 모든 벽돌이 파괴되었는지 확인
+            if self.bricks_left == 0:
+                self.game_won = True
+    
+    def find_brick_hit(self, ball_rect):
+        # 공이 걸쳐 있는 격자 칸의 벽돌만 검사 (맞은 벽돌 번호, 없으면 -1)
+        row_start = max(0, (ball_rect.top - BRICK_Y0) // BRICK_STRIDE_Y)
+        row_end = min(BRICK_ROWS - 1, (ball_rect.bottom - 1 - BRICK_Y0) // BRICK_STRIDE_Y)
+        col_start = max(0, (ball_rect.left - BRICK_X0) // BRICK_STRIDE_X)
+        col_end = min(BRICK_COLS - 1, (ball_rect.right - 1 - BRICK_X0) // BRICK_STRIDE_X)
         
-        # UI 그리기
-        score_text = self.small_font.render(f"점수: {self.score}", True, WHITE)
-        lives_text = self.small_font.render(f"생명: {self.lives}", True, WHITE)
-        self.screen.blit(score_text, (10, 10))
-        self.screen.blit(lives_text, (10, 35))
+        rects = self._brick_rects
+        for row in range(row_start, row_end + 1):
+            start = row * BRICK_COLS + col_start
+            hit = ball_rect.collidelist(rects[start:row * BRICK_COLS + col_end + 1])
+            if hit >= 0:
+                return start + hit
+        return -1
+    
+    def update_hud(self):
+        # 점수/생명 문구는 값이 바뀔 때만 다시 렌더링하고, 바뀐 영역을 반환
+        changed = []
+        if self._score_cache[0] != self.score:
+            text = self.small_font.render(f"점수: {self.score}", True, WHITE)
+            rect = text.get_rect(topleft=(10, 10))
+            if self._score_cache[2]:
+                changed.append(self._score_cache[2])
+            changed.append(rect)
+            self._score_cache = (self.score, text, rect)
+        if self._lives_cache[0] != self.lives:
+            text = self.small_font.render(f"생명: {self.lives}", True, WHITE)
+            rect = text.get_rect(topleft=(10, 35))
+            if self._lives_cache[2]:
+                changed.append(self._lives_cache[2])
+            changed.append(rect)
+            self._lives_cache = (self.lives, text, rect)
+        return changed
+    
+    def hud_items(self):
+        items = [self._score_cache[1:], self._lives_cache[1:]]
         
-        # 게임 오버 또는 승리 메시지
+        # 게임 오버 또는 승리 메시지, 진행 중에는 조작법 안내
         if self.game_over:
-            game_over_text = self.font.render("게임 오버! R키를 눌러 다시 시작", True, RED)
-            text_rect = game_over_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2))
-            self.screen.blit(game_over_text, text_rect)
+            items.append((self._game_over_text, self._game_over_rect))
         elif self.game_won:
-            win_text = self.font.render("축하합니다! 승리! R키를 눌러 다시 시작", True, GREEN)
-            text_rect = win_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2))
-            self.screen.blit(win_text, text_rect)
+            items.append((self._win_text, self._win_rect))
+        else:
+            items.append((self._help_text, self._help_rect))
+        return items
+    
+    def repaint(self, rect, hud):
+        # rect 영역만 배경, 벽돌, 문구로 다시 채움
+        screen = self.screen
+        screen.set_clip(rect)
+        screen.fill(BLACK)
+        
+        # 영역에 걸친 벽돌을 한 번의 blits 호출로 그림
+        sprites = self._brick_sprites
+        grid = self.brick_grid
+        rects = self._brick_rects
+        screen.blits([(sprites[grid[index].color], rects[index])
+                      for index in rect.collidelistall(rects)], doreturn=False)
         
-        # 조작법 안내
-        if not self.game_over and not self.game_won:
-            help_text = self.small_font.render("← → 키로 패들 조작, ESC로 종료", True, WHITE)
-            self.screen.blit(help_text, (SCREEN_WIDTH - 250, SCREEN_HEIGHT - 25))
+        for text, text_rect in hud:
+            if rect.colliderect(text_rect):
+                screen.blit(text, text_rect)
+        screen.set_clip(None)
+    
+    def draw(self):
+        # 이번 프레임에 바뀐 영역 목록을 반환 (pygame.display.update에 전달)
+        dirty = self.update_hud()
+        hud = self.hud_items()
+        
+        state = (self.game_over, self.game_won)
+        if self._full_redraw or state != self._drawn_state:
+            # 시작/재시작, 게임 오버/승리 전환 시에는 화면 전체를 다시 그림
+            self._full_redraw = False
+            self._drawn_state = state
+            dirty = [self.screen.get_rect()]
+        else:
+            # 이전 공/패들 자리와 부서진 벽돌 자리만 지우고 다시 채움
+            dirty.append(self._ball_area)
+            dirty.append(self._paddle_area)
+            dirty.extend(self._erase)
+        self._erase.clear()
+        
+        for rect in dirty:
+            self.repaint(rect, hud)
+        
+        # 게임 객체들 그리기
+        self._ball_area = self.ball.draw(self.screen)
+        self._paddle_area = self.paddle.draw(self.screen)
+        dirty.append(self._ball_area)
+        dirty.append(self._paddle_area)
+        return dirty
     
     def run(self):
         running = True
         
+        # 루프 안에서 매 프레임 찾지 않도록 지역 변수로 묶어 둠
+        QUIT = pygame.QUIT
+        KEYDOWN = pygame.KEYDOWN
+        K_ESCAPE = pygame.K_ESCAPE
+        K_r = pygame.K_r
+        K_LEFT = pygame.K_LEFT
+        K_RIGHT = pygame.K_RIGHT
+        event_get = pygame.event.get
+        get_pressed = pygame.key.get_pressed
+        update = pygame.display.update
+        tick = self.clock.tick
+        
         while running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
+            for event in event_get():
+                if event.type == QUIT:
                     running = False
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
+                elif event.type == KEYDOWN:
+                    if event.key == K_ESCAPE:
                         running = False
-                    elif event.key == pygame.K_r and (self.game_over or self.game_won):
+                    elif event.key == K_r and (self.game_over or self.game_won):
                         self.reset_game()
             
             # 키 입력 처리 (연속 입력)
-            keys = pygame.key.get_pressed()
-            if keys[pygame.K_LEFT]:
+            keys = get_pressed()
+            if keys[K_LEFT]:
                 self.paddle.move_left()
-            if keys[pygame.K_RIGHT]:
+            if keys[K_RIGHT]:
                 self.paddle.move_right()
             
             # 게임 로직 업데이트
@@ -219,9 +357,8 @@ class Game:
                 self.handle_collisions()
             
             # 화면 그리기
-            self.draw()
-            pygame.display.flip()
-            self.clock.tick(60)
+            update(self.draw())
+            tick(60)
         
         pygame.quit()
         sys.exit()
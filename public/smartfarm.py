@@ -1,23 +1,28 @@
 import time
 import random
 import datetime
-from dataclasses import dataclass
-from typing import List, Dict
+from collections import deque
+from typing import Deque, Dict
 import json
 
-@dataclass
-class SensorData:
-    """센서 데이터 클래스"""
-    timestamp: str
-    temperature: float
-    humidity: float
-    fan_status: bool
-    pump_status: bool
+try:
+    import orjson  # 설치되어 있으면 더 빠른 JSON 직렬화 사용 (pip install orjson)
+except ImportError:
+    orjson = None
+
+# 로그 보관 개수
+LOG_SIZE = 100
+
+def _to_json_line(record: Dict) -> bytes:
+    """로그 한 건을 JSON 한 줄(UTF-8 바이트)로 변환"""
+    if orjson is not None:
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n').encode('utf-8')
 
 class SmartFarmController:
     """스마트 팜 제어 시스템"""
     
-    def __init__(self):
+    def __init__(self, log_filename: str = "farm_log.ndjson"):
         # 제어 설정값
         self.temp_threshold = 30.0  # 온도 임계값 (℃)
         self.humidity_threshold = 40.0  # 습도 임계값 (%)
@@ -26,8 +31,23 @@ class SmartFarmController:
         self.fan_running = False
         self.pump_running = False
         
-        # 센서 데이터 로그
-        self.data_log: List[SensorData] = []
+        # 통계용 센서 데이터 (항목별로 나눠 저장, 최근 LOG_SIZE개만 유지)
+        self._temps: Deque[float] = deque(maxlen=LOG_SIZE)
+        self._humids: Deque[float] = deque(maxlen=LOG_SIZE)
+        self._fans: Deque[bool] = deque(maxlen=LOG_SIZE)
+        self._pumps: Deque[bool] = deque(maxlen=LOG_SIZE)
+        
+        # 타임스탬프 캐시 (같은 초 안에서는 문자열 재사용)
+        self._last_epoch = 0
+        self._last_timestamp = ""
+        
+        # 로그 파일 (한 줄 쓸 때마다 바로 반영, 열 수 없으면 메모리에만 기록)
+        self.log_filename = log_filename
+        try:
+            self._log_file = open(log_filename, 'ab')
+        except OSError as e:
+            self._log_file = None
+            print(f"❌ 로그 저장 실패: {e} (메모리에만 기록합니다)")
         
         # 시뮬레이션용 환경 변수
         self.current_temp = 25.0
@@ -61,7 +81,7 @@ class SmartFarmController:
         self.current_temp = max(15, min(45, self.current_temp))
         self.current_humidity = max(20, min(90, self.current_humidity))
         
-        return round(self.current_temp, 1), round(self.current_humidity, 1)
+        return self.current_temp, self.current_humidity
     
     def control_fan(self, turn_on: bool):
         """환풍기 제어"""
@@ -98,78 +118,96 @@ class SmartFarmController:
     
     def log_data(self, temperature: float, humidity: float):
         """데이터 로깅"""
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        data = SensorData(
-            timestamp=timestamp,
-            temperature=temperature,
-            humidity=humidity,
-            fan_status=self.fan_running,
-            pump_status=self.pump_running
-        )
-        self.data_log.append(data)
+        self._temps.append(temperature)
+        self._humids.append(humidity)
+        self._fans.append(self.fan_running)
+        self._pumps.append(self.pump_running)
+        
+        if self._log_file is None:
+            return
         
-        # 최근 100개 데이터만 유지
-        if len(self.data_log) > 100:
-            self.data_log.pop(0)
+        # 타임스탬프는 파일 기록에만 쓰임
+        now = int(time.time())
+        if now != self._last_epoch:
+            self._last_epoch = now
+            self._last_timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+        record = {
+            "timestamp": self._last_timestamp,
+            "temperature": temperature,
+            "humidity": humidity,
+            "fan_status": self.fan_running,
+            "pump_status": self.pump_running
+        }
+        try:
+            self._log_file.write(_to_json_line(record))
+            self._log_file.flush()
+        except OSError as e:
+            print(f"❌ 로그 저장 실패: {e} (메모리에만 기록합니다)")
+            self.close()
     
     def display_status(self, temperature: float, humidity: float):
         """현재 상태 출력"""
         print(f"\n📊 [{datetime.datetime.now().strftime('%H:%M:%S')}] 현재 상태")
-        print(f"🌡️  온도: {temperature}℃ {'⚠️ ' if temperature > self.temp_threshold else '✅'}")
-        print(f"💧 습도: {humidity}% {'⚠️ ' if humidity < self.humidity_threshold else '✅'}")
+        print(f"🌡️  온도: {temperature:.1f}℃ {'⚠️ ' if temperature > self.temp_threshold else '✅'}")
+        print(f"💧 습도: {humidity:.1f}% {'⚠️ ' if humidity < self.humidity_threshold else '✅'}")
         print(f"🌪️  환풍기: {'🟢 ON' if self.fan_running else '🔴 OFF'}")
         print(f"💦 펌프: {'🟢 ON' if self.pump_running else '🔴 OFF'}")
         print("-" * 40)
     
     def get_statistics(self) -> Dict:
         """통계 정보 반환"""
-        if not self.data_log:
+        count = len(self._temps)
+        if not count:
             return {}
         
-        temps = [data.temperature for data in self.data_log]
-        humids = [data.humidity for data in self.data_log]
+        temps = self._temps
+        humids = self._humids
         
         return {
-            "avg_temp": round(sum(temps) / len(temps), 1),
-            "max_temp": max(temps),
-            "min_temp": min(temps),
-            "avg_humidity": round(sum(humids) / len(humids), 1),
-            "max_humidity": max(humids),
-            "min_humidity": min(humids),
-            "fan_runtime": sum(1 for data in self.data_log if data.fan_status),
-            "pump_runtime": sum(1 for data in self.data_log if data.pump_status),
-            "total_records": len(self.data_log)
+            "avg_temp": round(sum(temps) / count, 1),
+            "max_temp": round(max(temps), 1),
+            "min_temp": round(min(temps), 1),
+            "avg_humidity": round(sum(humids) / count, 1),
+            "max_humidity": round(max(humids), 1),
+            "min_humidity": round(min(humids), 1),
+            "fan_runtime": sum(self._fans),
+            "pump_runtime": sum(self._pumps),
+            "total_records": count
         }
     
-    def save_log_to_file(self, filename: str = "farm_log.json"):
-        """로그를 파일로 저장"""
+    def save_log_to_file(self):
+        """기록 중인 로그를 파일에 반영"""
+        if self._log_file is None:
+            print(f"❌ 로그 저장 실패: {self.log_filename}에 기록할 수 없습니다.")
+            return
         try:
-            data_dict = [
-                {
-                    "timestamp": data.timestamp,
-                    "temperature": data.temperature,
-                    "humidity": data.humidity,
-                    "fan_status": data.fan_status,
-                    "pump_status": data.pump_status
-                }
-                for data in self.data_log
-            ]
-            
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(data_dict, f, ensure_ascii=False, indent=2)
-            print(f"📝 로그가 {filename}에 저장되었습니다.")
+            self._log_file.flush()
+            print(f"📝 로그가 {self.log_filename}에 저장되었습니다.")
         except Exception as e:
             print(f"❌ 로그 저장 실패: {e}")
     
+    def close(self):
+        """로그 파일 닫기"""
+        if self._log_file is None:
+            return
+        try:
+            self._log_file.close()
+        except OSError:
+            pass
+        self._log_file = None
+    
     def run_monitoring_cycle(self, duration_minutes: int = 5):
         """모니터링 사이클 실행"""
         print(f"🔄 {duration_minutes}분간 모니터링을 시작합니다...")
         print("Ctrl+C를 눌러 중단할 수 있습니다.\n")
         
         cycle_count = 0
+        next_deadline = time.monotonic()
         
         try:
             while cycle_count < duration_minutes * 12:  # 5초마다 체크
+                next_deadline += 5
+                
                 # 센서 데이터 읽기
                 temperature, humidity = self.read_sensors()
                 
@@ -184,7 +222,11 @@ class SmartFarmController:
                     self.display_status(temperature, humidity)
                 
                 cycle_count += 1
-                time.sleep(5)  # 5초 대기
+                
+                # 다음 측정 시각까지 대기 (처리 시간을 빼서 5초 주기 유지, 늦었으면 바로 진행)
+                delay = next_deadline - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
                 
         except KeyboardInterrupt:
             print("\n\n⏹️  모니터링이 중단되었습니다.")
@@ -201,6 +243,61 @@ class SmartFarmController:
         # 로그 저장
         self.save_log_to_file()
 
+def _cmd_monitor(farm: SmartFarmController):
+    """1. 실시간 모니터링"""
+    duration = input("모니터링 시간을 입력하세요 (분, 기본값 5): ").strip()
+    try:
+        duration = int(duration) if duration else 5
+    except ValueError:
+        duration = 5
+    if duration <= 0:
+        duration = 5
+    farm.run_monitoring_cycle(duration)
+
+def _cmd_single(farm: SmartFarmController):
+    """2. 단일 측정 및 제어"""
+    temp, humidity = farm.read_sensors()
+    farm.make_control_decisions(temp, humidity)
+    farm.log_data(temp, humidity)
+    farm.display_status(temp, humidity)
+
+def _cmd_config(farm: SmartFarmController):
+    """3. 설정 변경"""
+    print(f"\n현재 설정:")
+    print(f"온도 임계값: {farm.temp_threshold}℃")
+    print(f"습도 임계값: {farm.humidity_threshold}%")
+    
+    try:
+        new_temp = input("새 온도 임계값 (엔터로 유지): ").strip()
+        new_humidity = input("새 습도 임계값 (엔터로 유지): ").strip()
+        
+        if new_temp:
+            farm.temp_threshold = float(new_temp)
+        if new_humidity:
+            farm.humidity_threshold = float(new_humidity)
+        
+        print("✅ 설정이 업데이트되었습니다.")
+    except ValueError:
+        print("❌ 잘못된 값입니다.")
+
+def _cmd_stats(farm: SmartFarmController):
+    """4. 통계 보기"""
+    stats = farm.get_statistics()
+    if stats:
+        print("\n📈 현재 통계:")
+        print(f"   총 기록: {stats['total_records']}개")
+        print(f"   평균 온도: {stats['avg_temp']}℃")
+        print(f"   평균 습도: {stats['avg_humidity']}%")
+        print(f"   환풍기 동작률: {stats['fan_runtime']/stats['total_records']*100:.1f}%")
+        print(f"   펌프 동작률: {stats['pump_runtime']/stats['total_records']*100:.1f}%")
+    else:
+        print("📊 아직 데이터가 없습니다.")
+
+def _cmd_quit(farm: SmartFarmController) -> bool:
+    """5. 종료 (True를 반환하면 메뉴 루프 종료)"""
+    print("👋 스마트 팜 시스템을 종료합니다.")
+    return True
+
 def main():
     """메인 함수"""
     print("🌱 스마트 팜 온도습도 제어 시스템")
@@ -209,6 +306,15 @@ def main():
     # 스마트 팜 컨트롤러 생성
     farm = SmartFarmController()
     
+    # 메뉴 번호별 처리 함수
+    dispatch = {
+        '1': _cmd_monitor,
+        '2': _cmd_single,
+        '3': _cmd_config,
+        '4': _cmd_stats,
+        '5': _cmd_quit,
+    }
+    
     while True:
         print("\n메뉴를 선택하세요:")
         print("1. 실시간 모니터링 시작 (5분)")
@@ -220,59 +326,19 @@ def main():
         try:
             choice = input("\n선택 (1-5): ").strip()
             
-            if choice == '1':
-                duration = input("모니터링 시간을 입력하세요 (분, 기본값 5): ").strip()
-                duration = int(duration) if duration.isdigit() else 5
-                farm.run_monitoring_cycle(duration)
-                
-            elif choice == '2':
-                temp, humidity = farm.read_sensors()
-                farm.make_control_decisions(temp, humidity)
-                farm.log_data(temp, humidity)
-                farm.display_status(temp, humidity)
-                
-            elif choice == '3':
-                print(f"\n현재 설정:")
-                print(f"온도 임계값: {farm.temp_threshold}℃")
-                print(f"습도 임계값: {farm.humidity_threshold}%")
-                
-                try:
-                    new_temp = input("새 온도 임계값 (엔터로 유지): ").strip()
-                    new_humidity = input("새 습도 임계값 (엔터로 유지): ").strip()
-                    
-                    if new_temp:
-                        farm.temp_threshold = float(new_temp)
-                    if new_humidity:
-                        farm.humidity_threshold = float(new_humidity)
-                    
-                    print("✅ 설정이 업데이트되었습니다.")
-                except ValueError:
-                    print("❌ 잘못된 값입니다.")
-                
-            elif choice == '4':
-                stats = farm.get_statistics()
-                if stats:
-                    print("\n📈 현재 통계:")
-                    print(f"   총 기록: {stats['total_records']}개")
-                    print(f"   평균 온도: {stats['avg_temp']}℃")
-                    print(f"   평균 습도: {stats['avg_humidity']}%")
-                    print(f"   환풍기 동작률: {stats['fan_runtime']/stats['total_records']*100:.1f}%")
-                    print(f"   펌프 동작률: {stats['pump_runtime']/stats['total_records']*100:.1f}%")
-                else:
-                    print("📊 아직 데이터가 없습니다.")
-                
-            elif choice == '5':
-                print("👋 스마트 팜 시스템을 종료합니다.")
-                break
-                
-            else:
+            handler = dispatch.get(choice)
+            if handler is None:
                 print("❌ 잘못된 선택입니다.")
+            elif handler(farm):
+                break
                 
         except KeyboardInterrupt:
             print("\n👋 프로그램을 종료합니다.")
             break
         except Exception as e:
             print(f"❌ 오류가 발생했습니다: {e}")
+    
+    farm.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file